@@ -1,42 +1,141 @@
 import asyncio
+import logging
+import math
+import queue
 import random
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
 from poke_env.player import Player
 from poke_env import AccountConfiguration
 from poke_env.battle.move_category import MoveCategory
+from poke_env.battle.target import Target
 from poke_env.calc.damage_calc_gen9 import calculate_damage
+from poke_env.teambuilder import ConstantTeambuilder
+
+logger = logging.getLogger(__name__)
+
+# Number of battles the bot plays at the same time
+MAX_CONCURRENT_BATTLES = 10
+
+# Estimated turns left in early / mid / late game (see estimate_remaining_turns)
+REMAINING_TURNS_BY_PHASE = (12, 8, 4)
+
+# "Typical" damage score (100-150 range) used as the status-move anchor when no
+# damaging move is available or every damage calculation failed
+DEFAULT_DAMAGE_SCORE = 120
+
+# Average HP lost to entry hazards per switch-in (see evaluate_hazard and
+# evaluate_hazard_removal)
+HAZARD_DAMAGE_PER_SWITCH = 25
+
+# Score of a utility move without a dedicated evaluator (see evaluate_utility)
+DEFAULT_UTILITY_SCORE = 50
+
+# Longest wait (seconds) between acceptor restarts while the server keeps failing
+MAX_RETRY_DELAY = 30
+
+# Per-battle bookkeeping (e.g. used_trick) keeps only this many most recent battles,
+# well above MAX_CONCURRENT_BATTLES, so a long-running bot uses constant memory
+MAX_TRACKED_BATTLES = 256
+
+# Errors calculate_damage raises on moves/sets it cannot model. Anything else is a bug
+# and should surface (bare except also swallowed KeyboardInterrupt and SystemExit)
+DAMAGE_CALC_ERRORS = (KeyError, AttributeError, ValueError, ZeroDivisionError)
+
+# max() key for the healthiest switch, built once rather than on every decision
+HP_FRACTION_KEY = attrgetter('current_hp_fraction')
+
+@dataclass(slots=True, frozen=True)
+class TurnContext:
+    """Values shared by every move evaluation within one decision (see get_turn_context)."""
+    active: object           # battle.active_pokemon
+    opponent: object         # battle.opponent_active_pokemon
+    poison_heal: bool        # our active Pokemon has Poison Heal (see evaluate_protect)
+    damage_scores: dict      # move id -> average expected damage, damaging moves only
+    our_remaining: int       # non-fainted Pokemon on our side
+    opp_remaining: int       # non-fainted Pokemon on the opponent's side
+    remaining_turns: int     # estimate_remaining_turns() for this turn
+    best_damage: float       # highest damage score of any move, or DEFAULT_DAMAGE_SCORE
+    best_phys_damage: float  # same, physical moves only (see evaluate_debuff)
+    best_spec_damage: float  # same, special moves only (see evaluate_debuff)
+    ko_move: object          # most accurate move whose lowest roll KOs the opponent, or None
+
+@dataclass(slots=True, frozen=True)
+class DamageStats:
+    """Summary of one calculate_damage result, shared by every reader (see get_damage_stats)."""
+    average: float
+    minimum: float
+
+@dataclass(slots=True, frozen=True)
+class MoveInfo:
+    """Static data of one move, read from poke-env once per move id (see get_move_info)."""
+    category: MoveCategory
+    accuracy: float
+    side_condition: object  # hazard id, or None
+    self_boost: dict | None
+    boosts: dict | None
+    status_evaluator: object  # bound evaluate_* method for status moves, else None
 
 class MyAgent(Player):
-    # OLD FIXED CONSTANTS - NO LONGER USED
-    # These have been replaced with dynamic calculations based on damage context
-    # and turn economy. Kept for reference only.
-    # HAZARD_SCORE = 400
-    # SETUP_SCORE = 500
-    # STATUS_SCORE = 300
-    # PROTECT_SCORE = 250
-    # DEBUFF_SCORE = 200
-
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Track one-time utility moves per battle
-        self.used_trick = {}  # battle_tag -> bool
+        self.used_trick = OrderedDict()  # battle_tag -> bool, oldest battle first
+        # Shared evaluation values for the decision in progress
+        self._turn_cache = {}  # (battle_tag, turn) -> TurnContext
+        # calculate_damage results for the decision in progress
+        self._damage_cache = {}  # (move_id, attacker, defender, battle) -> DamageStats
+        # Type multipliers only depend on the two typings involved
+        self._type_matchup_cache = {}  # (our types, their types) -> (offensive, defensive)
+        # Move data never changes, so it is read from poke-env once per move id
+        self._move_info = {}  # move_id -> MoveInfo
+        # Moves the damage calculator failed on; skip straight to the fallback next time
+        self._damage_calc_failures = OrderedDict()  # battle_tag -> {move_id}, oldest first
+        # Status utility moves with a dedicated evaluator, keyed by exact move id and
+        # bound like the evaluators classify_status_move returns
+        self._utility_evaluators = {
+            "trick": self.evaluate_trick,
+            "defog": self.evaluate_hazard_removal,
+        }  # move_id -> bound evaluate_* method
 
     def choose_move(self, battle):
-        # Always prioritize moves over switching
-        if battle.available_moves:
-            # Score all available moves
-            move_scores = [
-                (move, self.calculate_move_score(battle, move))
-                for move in battle.available_moves
-            ]
+        # Bind hot attributes once; they are read several times per decision
+        moves = battle.available_moves
+        switches = battle.available_switches
+        order = self.create_order
 
-            # Pick the highest scoring move
-            best_move, best_score = max(move_scores, key=lambda x: x[1])
-            return self.create_order(best_move)
+        # Always prioritize moves over switching
+        if moves:
+            # Choice-locked or forced: nothing to compare, skip scoring entirely
+            if len(moves) == 1:
+                return order(moves[0])
+
+            # Turn context is built once per decision; drop entries from earlier turns
+            self._turn_cache.clear()
+            self._damage_cache.clear()
+
+            # A guaranteed KO beats anything a status move could offer: take it
+            # without scoring the remaining moves
+            ko_move = self.get_turn_context(battle).ko_move
+            if ko_move is not None:
+                return order(ko_move)
+
+            # Score all available moves, keeping the first highest scoring one
+            best_move, best_score = None, -math.inf
+            for move in moves:
+                score = self.calculate_move_score(battle, move)
+                if score > best_score:
+                    best_move, best_score = move, score
+
+            return order(best_move)
 
         # Only switch if we have no moves available (e.g., all PP depleted)
-        if battle.available_switches:
-            switch = max(battle.available_switches, key=lambda p: p.current_hp_fraction)
-            return self.create_order(switch)
+        if switches:
+            switch = max(switches, key=HP_FRACTION_KEY)
+            return order(switch)
 
         # Fallback: random valid order
         return self.choose_random_move(battle)
@@ -54,7 +153,7 @@ class MyAgent(Player):
         """
         return sum(1 for mon in team.values() if not mon.fainted)
 
-    def estimate_remaining_turns(self, battle):
+    def estimate_remaining_turns(self, battle, our_remaining=None, opp_remaining=None):
         """
         Estimate how many turns remain in the battle.
 
@@ -67,21 +166,23 @@ class MyAgent(Player):
         - Adjust down if teams are severely weakened (fewer Pokemon = shorter battle)
         - Cap between 3-15 turns to avoid extreme values
 
+        Args:
+            battle: The current battle state
+            our_remaining, opp_remaining: Optional precomputed mon counts, to avoid
+                     walking both teams again when the caller already has them
+
         Returns: Estimated remaining turns (int, 3-15)
         """
-        turn = battle.turn if hasattr(battle, 'turn') else 0
+        turn = battle.turn
 
-        # Base estimate from turn number
-        if turn <= 5:
-            base_estimate = 12  # Early game: ~12 turns remaining
-        elif turn <= 15:
-            base_estimate = 8   # Mid game: ~8 turns remaining
-        else:
-            base_estimate = 4   # Late game: ~4 turns remaining
+        # Base estimate from turn number: early (<= 5), mid (<= 15) or late game
+        base_estimate = REMAINING_TURNS_BY_PHASE[(turn > 5) + (turn > 15)]
 
         # Adjust based on remaining Pokemon (fewer mons = shorter battle)
-        our_remaining = self.count_remaining_mons(battle.team)
-        opp_remaining = self.count_remaining_mons(battle.opponent_team)
+        if our_remaining is None:
+            our_remaining = self.count_remaining_mons(battle.team)
+        if opp_remaining is None:
+            opp_remaining = self.count_remaining_mons(battle.opponent_team)
         min_remaining = min(our_remaining, opp_remaining)
 
         # If either team has 1-2 Pokemon left, battle will end sooner
@@ -91,38 +192,97 @@ class MyAgent(Player):
         # Clamp to reasonable range
         return max(3, min(15, base_estimate))
 
-    def get_best_damage_score(self, battle, category=None):
+    def get_turn_context(self, battle):
         """
-        Get the highest damage score among available moves.
+        Get the values shared by every move evaluation this turn.
 
-        Utility: Used to anchor status move scores to damage output. Instead of using
-        arbitrary fixed values (200, 300, etc.), status moves are valued relative to
-        the damage we could deal. This creates a unified scoring scale.
+        Utility: calculate_damage dominates decision time, and the best damage move,
+        the best damage scores, the remaining-turn estimate and the mon counts are
+        needed by several evaluators. Computing them once per (battle, turn) turns
+        the old O(moves^2) damage calculations and repeated team walks per decision
+        into a single pass.
 
-        Args:
-            battle: The current battle state
-            category: Optional MoveCategory filter (PHYSICAL or SPECIAL). If provided,
-                     only considers moves of that category. Used for debuffs that only
-                     boost specific attack types (Screech for physical, Fake Tears for special).
+        Returns: TurnContext for the current turn
+        """
+        key = (battle.battle_tag, battle.turn)
+        ctx = self._turn_cache.get(key)
+        if ctx is None:
+            ctx = self._turn_cache[key] = self.build_turn_context(battle)
+        return ctx
 
-        Returns: Float representing the highest damage score available, or fallback value
-                 of 120 if no damage moves or calculation fails
+    def build_turn_context(self, battle):
         """
-        best_score = 0
+        Compute a TurnContext from scratch. Use get_turn_context() instead, which
+        caches the result for the rest of the turn.
+        """
+        # Single sweep over the moves: damage table and per-category maxima
+        damage_scores = {}
+        best_phys_damage = best_spec_damage = 0
+        ko_move, ko_rank = None, None  # ko_rank: (accuracy, score) of ko_move
+
+        # Loop-invariant lookups bound to locals
+        physical, special, status = MoveCategory.PHYSICAL, MoveCategory.SPECIAL, MoveCategory.STATUS
+        get_move_info = self.get_move_info
+        estimate_move_damage = self.estimate_move_damage
+
+        # A move is a guaranteed KO when even its lowest roll takes the opponent's
+        # remaining HP. The calculator returns HP points while the opponent's
+        # current_hp is on a 0-100 (or pixel) scale, so convert through the fraction
+        # and the HP stat. The HP stat is unknown in gen9ou, where no move qualifies
+        opponent = battle.opponent_active_pokemon
+        hp_stat = opponent.stats.get("hp") if opponent is not None else None
+        opponent_hp = opponent.current_hp_fraction * hp_stat if hp_stat else 0
 
         for move in battle.available_moves:
-            # Skip if we're filtering by category and move doesn't match
-            if category and move.category != category:
+            info = get_move_info(move)
+            category = info.category
+            if category == status:
                 continue
 
-            # Only consider damaging moves
-            if move.category in [MoveCategory.PHYSICAL, MoveCategory.SPECIAL]:
-                score = self.evaluate_damage_move(battle, move)
-                best_score = max(best_score, score)
+            damage_stats = estimate_move_damage(battle, move)
+            # Fallback: poke-env always reports base_power as an int (0 for
+            # variable-power moves)
+            score = damage_scores[move.id] = (
+                move.base_power if damage_stats is None else damage_stats.average
+            )
+            if category == physical:
+                best_phys_damage = max(best_phys_damage, score)
+            elif category == special:
+                best_spec_damage = max(best_spec_damage, score)
+
+            if (
+                opponent_hp
+                and damage_stats is not None
+                and damage_stats.minimum >= opponent_hp
+            ):
+                # Every candidate KOs, so extra damage is worth nothing: prefer the
+                # move most likely to hit, and only break accuracy ties on damage
+                rank = (info.accuracy, score)
+                if ko_rank is None or rank > ko_rank:
+                    ko_move, ko_rank = move, rank
+
+        our_remaining = self.count_remaining_mons(battle.team)
+        opp_remaining = self.count_remaining_mons(battle.opponent_team)
+
+        best_damage = max(best_phys_damage, best_spec_damage)
+
+        active = battle.active_pokemon
 
         # Fallback: if no damaging moves or all failed, use reasonable default
-        # This represents "typical" damage output (100-150 range)
-        return best_score if best_score > 0 else 120
+        return TurnContext(
+            active=active,
+            opponent=battle.opponent_active_pokemon,
+            # poke-env stores abilities as ids ("poisonheal"), not display names
+            poison_heal=active.ability == "poisonheal",
+            damage_scores=damage_scores,
+            our_remaining=our_remaining,
+            opp_remaining=opp_remaining,
+            remaining_turns=self.estimate_remaining_turns(battle, our_remaining, opp_remaining),
+            best_damage=best_damage if best_damage > 0 else DEFAULT_DAMAGE_SCORE,
+            best_phys_damage=best_phys_damage if best_phys_damage > 0 else DEFAULT_DAMAGE_SCORE,
+            best_spec_damage=best_spec_damage if best_spec_damage > 0 else DEFAULT_DAMAGE_SCORE,
+            ko_move=ko_move,
+        )
 
     def estimate_matchup(self, mon, opponent):
         """
@@ -143,24 +303,33 @@ class MyAgent(Player):
 
         score = 0
 
+        # poke-env returns types as a list; tuples make the pair hashable
+        key = (tuple(mon.types), tuple(opponent.types))
+        advantages = self._type_matchup_cache.get(key)
+        if advantages is None:
+            offensive_advantage = max(
+                [opponent.damage_multiplier(t) for t in mon.types if t is not None],
+                default=1
+            )
+            defensive_advantage = max(
+                [mon.damage_multiplier(t) for t in opponent.types if t is not None],
+                default=1
+            )
+            advantages = self._type_matchup_cache[key] = (offensive_advantage, defensive_advantage)
+        offensive_advantage, defensive_advantage = advantages
+
         # Offensive type advantage
-        offensive_advantage = max(
-            [opponent.damage_multiplier(t) for t in mon.types if t is not None],
-            default=1
-        )
         score += (offensive_advantage - 1) * 2  # Scale: -2 to +6
 
         # Defensive type advantage
-        defensive_advantage = max(
-            [mon.damage_multiplier(t) for t in opponent.types if t is not None],
-            default=1
-        )
         score -= (defensive_advantage - 1) * 2  # Penalize weakness
 
         # Speed advantage
-        if mon.base_stats.get("spe", 0) > opponent.base_stats.get("spe", 0):
+        our_speed = mon.base_stats.get("spe", 0)
+        their_speed = opponent.base_stats.get("spe", 0)
+        if our_speed > their_speed:
             score += 1
-        elif mon.base_stats.get("spe", 0) < opponent.base_stats.get("spe", 0):
+        elif our_speed < their_speed:
             score -= 1
 
         # HP advantage
@@ -169,31 +338,6 @@ class MyAgent(Player):
 
         return score
 
-    def can_ohko(self, attacker, defender, move):
-        """
-        Check if a move can potentially one-hit KO the defender.
-
-        Utility: Used to identify guaranteed knockout opportunities. Could be used
-        to prioritize finishing off weakened opponents or to assess risk when
-        deciding whether to set up (don't set up if opponent can OHKO us).
-
-        Returns: True if max damage >= defender's HP, False otherwise
-        """
-        try:
-            damage_range = calculate_damage(
-                attacker=attacker,
-                defender=defender,
-                move=move,
-                battle=None  # Not all parameters needed for estimate
-            )
-            if damage_range:
-                max_damage = max(damage_range)
-                defender_hp = defender.max_hp if defender.max_hp else 100
-                return max_damage >= defender_hp
-        except:
-            pass
-        return False
-
     def is_favorable_setup_situation(self, battle):
         """
         Check if it's a good situation to use setup moves (Swords Dance, etc.).
@@ -224,9 +368,77 @@ class MyAgent(Player):
     # ==================== Move Evaluation Methods ====================
     # These methods score moves to determine which is best to use
 
-    def evaluate_damage_move(self, battle, move):
+    def get_damage_stats(self, attacker, defender, move, battle):
+        """
+        Run calculate_damage and summarize it, memoized for the decision in progress.
+
+        Utility: The damage calculator is the most expensive call we make, so each
+        (attacker, defender, move) combination is computed and summarized at most
+        once per decision. The cache is cleared by choose_move before
+        every decision, which also keeps the identity-based key valid.
+
+        Returns: DamageStats of the (min, max) damage rolls
+                 (errors propagate and are not cached)
+        """
+        key = (move.id, id(attacker), id(defender), id(battle))
+        if key in self._damage_cache:
+            return self._damage_cache[key]
+
+        # The calculator looks both Pokemon up in the battle by Showdown identifier
+        attacker_role, defender_role = battle.player_role, battle.opponent_role
+        if attacker not in battle.team.values():
+            attacker_role, defender_role = defender_role, attacker_role
+
+        min_damage, max_damage = calculate_damage(
+            attacker.identifier(attacker_role),
+            defender.identifier(defender_role),
+            move,
+            battle
+        )
+        damage_stats = self._damage_cache[key] = DamageStats(
+            (min_damage + max_damage) / 2, min_damage
+        )
+        return damage_stats
+
+    def can_calculate_damage(self, attacker, defender):
+        """
+        Check if calculate_damage can model this attacker/defender pair at all.
+
+        Utility: The calculator asserts that both Pokemon have known stats, which
+        poke-env only has for our own team and for opponents whose set is known
+        (e.g. random battles). Checking up front sends the other cases straight to
+        the base-power fallback without recording a failure for the move.
+
+        Returns: True if both Pokemon are present and all their stats are known
+        """
+        return (
+            attacker is not None and defender is not None
+            and None not in attacker.stats.values()
+            and None not in defender.stats.values()
+        )
+
+    def get_damage_calc_failures(self, battle):
+        """
+        Get the ids of moves the damage calculator failed on in this battle.
+
+        Utility: A failure can depend on the sets and field in one battle, so it
+        only sends the move to the base-power fallback for the rest of that battle
+        rather than for the life of the bot. Only the MAX_TRACKED_BATTLES most
+        recent battles are kept.
+
+        Returns: Set of move ids for the battle (add to it to record a failure)
+        """
+        battle_tag = battle.battle_tag
+        failures = self._damage_calc_failures.get(battle_tag)
+        if failures is None:
+            failures = self._damage_calc_failures[battle_tag] = set()
+            if len(self._damage_calc_failures) > MAX_TRACKED_BATTLES:
+                self._damage_calc_failures.popitem(last=False)
+        return failures
+
+    def estimate_move_damage(self, battle, move):
         """
-        Evaluate offensive moves using comprehensive damage calculation.
+        Estimate the damage of our active Pokemon's move on the opponent's.
 
         Utility: Replaces the old "highest base power" approach with actual damage
         calculation. Now considers ALL damage modifiers including:
@@ -239,41 +451,35 @@ class MyAgent(Player):
         - Status conditions (Burn halves physical damage)
         - Screens (Reflect/Light Screen)
 
-        Returns: Average expected damage (used as score to compare with status moves)
+        build_turn_context scores the move with the average damage and checks for a
+        guaranteed KO with the minimum, both from this one result.
+
+        Returns: DamageStats, or None when the calculator can't be used and the move
+                 falls back to its base power
         """
+        # Known failure in this battle: don't raise again
+        failures = self.get_damage_calc_failures(battle)
+        if move.id in failures:
+            return None
+
+        # No Pokemon on one side, or stats we don't know (usually the opponent's):
+        # checked up front so the calculator doesn't raise and blacklist the move
+        attacker, defender = battle.active_pokemon, battle.opponent_active_pokemon
+        if not self.can_calculate_damage(attacker, defender):
+            return None
+
         try:
-            damage_range = calculate_damage(
-                attacker=battle.active_pokemon,
-                defender=battle.opponent_active_pokemon,
+            return self.get_damage_stats(
+                attacker=attacker,
+                defender=defender,
                 move=move,
                 battle=battle
             )
-            if damage_range:
-                # Return average damage as score
-                return sum(damage_range) / len(damage_range)
-        except:
-            # Fallback to base power if calculation fails
-            return move.base_power if move.base_power else 0
-        return 0
+        except DAMAGE_CALC_ERRORS as e:
+            self.logger.debug("Damage calculation failed for %s: %r", move.id, e)
+            failures.add(move.id)
+            return None
     
-    def max_dmg_move(self, battle):
-        """
-        Identify the move with the highest potential damage.
-
-        """
-        best_move = None
-        highest_damage = -1
-
-        for move in battle.available_moves:
-            if move.category != MoveCategory.STATUS:
-                damage = self.evaluate_damage_move(battle, move)
-                if damage > highest_damage:
-                    highest_damage = damage
-                    best_move = move
-
-        return best_move
-
-
     def calculate_move_score(self, battle, move):
         """
         Main scoring dispatcher for all moves.
@@ -283,14 +489,15 @@ class MyAgent(Player):
         creates a unified scoring system where all moves (damaging and non-damaging)
         are scored on the same scale, allowing direct comparison.
 
+        Damage moves score their own expected damage; choose_move takes the max over
+        all scores, so the strongest attack still wins among damage moves.
+
         Returns: Numeric score (higher = better)
         """
-        if move.category == MoveCategory.STATUS:
+        if self.get_move_info(move).category == MoveCategory.STATUS:
             return self.evaluate_status_move(battle, move)
-        elif move == self.max_dmg_move(battle):
-            return self.evaluate_damage_move(battle, move)
-        else:
-            return 0  # Non-max damage moves get no score
+        return self.get_turn_context(battle).damage_scores[move.id]
+
     def evaluate_status_move(self, battle, move):
         """
         Evaluate status moves based on battle context.
@@ -302,33 +509,80 @@ class MyAgent(Player):
         - Status infliction (Toxic, Will-O-Wisp, Thunder Wave)
         - Protection (Protect, Detect)
         - Debuffs (Screech, Intimidate)
-        - Utility (Trick, Rapid Spin, U-turn/Volt Switch)
+        - Utility (Trick, Defog)
 
         Returns: Context-based score (0-500+)
         """
+        return self.get_move_info(move).status_evaluator(battle, move)
+
+    def get_move_info(self, move):
+        """
+        Get the static data of a move.
+
+        Utility: Move attributes are properties that look up poke-env's move table
+        on every access. The evaluators read the same few fields every turn, so
+        they are copied into a MoveInfo the first time a move id is seen.
+
+        Returns: MoveInfo for this move
+        """
+        info = self._move_info.get(move.id)
+        if info is None:
+            category = move.category
+            # poke-env lists the boosts of self-targeting moves (Swords Dance) under
+            # boosts; self_boost only holds the side effects of other moves
+            self_boost = move.self_boost or (
+                move.boosts if move.target == Target.SELF else None
+            )
+            info = self._move_info[move.id] = MoveInfo(
+                category=category,
+                accuracy=move.accuracy,
+                side_condition=move.side_condition,
+                self_boost=self_boost,
+                boosts=move.boosts,
+                status_evaluator=(
+                    self.classify_status_move(move, self_boost)
+                    if category == MoveCategory.STATUS else None
+                ),
+            )
+        return info
+
+    def classify_status_move(self, move, self_boost):
+        """
+        Pick the evaluator for a status move.
+
+        Utility: The category only depends on static move data, so the result is
+        stored in the move's MoveInfo instead of re-testing five move attributes
+        every turn.
+
+        Args:
+            move: The status move
+            self_boost: The boosts the move gives its user (see get_move_info)
+
+        Returns: The bound evaluate_* method to score this move with
+        """
         # Entry Hazards (Stealth Rock, Spikes, etc.)
         if move.side_condition:
-            return self.evaluate_hazard(battle, move)
+            return self.evaluate_hazard
 
         # Setup Moves (Swords Dance, etc.)
-        elif move.self_boost:
-            return self.evaluate_setup_move(battle, move)
+        elif self_boost:
+            return self.evaluate_setup_move
 
         # Status Infliction (Toxic, etc.)
         elif move.status:
-            return self.evaluate_status_infliction(battle, move)
+            return self.evaluate_status_infliction
 
         # Protection (Protect)
         elif move.is_protect_move:
-            return self.evaluate_protect(battle, move)
+            return self.evaluate_protect
 
         # Opponent debuffs (Screech, etc.)
         elif move.boosts:
-            return self.evaluate_debuff(battle, move)
+            return self.evaluate_debuff
 
         # Other utility moves
         else:
-            return self.evaluate_utility(battle, move)
+            return self.evaluate_utility
 
     # ==================== Status Move Evaluators ====================
     # Each function evaluates a specific category of status move
@@ -346,10 +600,10 @@ class MyAgent(Player):
 
         Returns: Expected HP damage from hazards over remaining battle (0-400+)
         """
-        opponent_remaining = self.count_remaining_mons(battle.opponent_team)
+        opponent_remaining = self.get_turn_context(battle).opp_remaining
 
         # Check if hazard already active
-        if move.side_condition in battle.opponent_side_conditions:
+        if self.get_move_info(move).side_condition in battle.opponent_side_conditions:
             return 0
 
         # Only worth it if opponent has 3+ Pokemon
@@ -358,10 +612,8 @@ class MyAgent(Player):
             expected_switches = opponent_remaining * 2.5
 
             # Stealth Rock: ~12.5% on neutral, ~25% on 2x weak, ~6% on resistant
-            # Use conservative average of ~25 HP per switch
-            avg_hazard_damage = 25
-
-            return expected_switches * avg_hazard_damage
+            # Use conservative average per switch
+            return expected_switches * HAZARD_DAMAGE_PER_SWITCH
 
         return 0
 
@@ -380,23 +632,28 @@ class MyAgent(Player):
 
         Returns: Extra damage from boosted attacks minus opportunity cost (0-300+)
         """
-        active = battle.active_pokemon
-
+        # Checked here rather than in the turn context: the matchup estimate is only
+        # needed on turns where a setup move is actually scored
         if not self.is_favorable_setup_situation(battle):
             return 0
 
+        ctx = self.get_turn_context(battle)
+        active = ctx.active
+
         # Find best damage move to calculate boost value
-        best_damage = self.get_best_damage_score(battle)
-        remaining_turns = self.estimate_remaining_turns(battle)
+        best_damage = ctx.best_damage
+        remaining_turns = ctx.remaining_turns
 
         # Estimate attacks before switch/death (typically 2-4)
         # Conservative: assume 3 attacks, but cap by remaining turns
         expected_attacks = min(3, remaining_turns // 2)
 
-        # Check if we can boost further
-        if move.self_boost:
-            for stat, boost_amount in move.self_boost.items():
-                current_boost = active.boosts.get(stat, 0)
+        # Check if we can boost further; the first stat that can still move decides
+        self_boost = self.get_move_info(move).self_boost
+        if self_boost:
+            active_boosts = active.boosts
+            for stat, boost_amount in self_boost.items():
+                current_boost = active_boosts.get(stat, 0)
 
                 if boost_amount > 0 and current_boost < 6:
                     # +2 stat boost (standard for Swords Dance, Nasty Plot, etc.)
@@ -435,14 +692,15 @@ class MyAgent(Player):
 
         Returns: Expected HP damage from status over remaining turns (0-200+)
         """
-        opponent = battle.opponent_active_pokemon
+        ctx = self.get_turn_context(battle)
+        opponent = ctx.opponent
 
         # Don't use if opponent already has status
         if not opponent or opponent.status:
             return 0
 
         opponent_hp = opponent.max_hp if opponent.max_hp else 100
-        remaining_turns = self.estimate_remaining_turns(battle)
+        remaining_turns = ctx.remaining_turns
 
         # Toxic: 1/16, 2/16, 3/16... (increasing damage)
         # Burn: 1/16 per turn + halves physical attack
@@ -450,20 +708,21 @@ class MyAgent(Player):
         # Sleep: 1-3 turns of lost actions
         # Average these effects to ~4% HP per turn
 
-        if move.accuracy >= 0.85:
+        accuracy = self.get_move_info(move).accuracy
+        if accuracy >= 0.85:
             # Cap at 8 turns to avoid overvaluing
             turns_active = min(remaining_turns, 8)
             hp_damage = opponent_hp * 0.04 * turns_active
 
             # Factor in accuracy
-            return hp_damage * move.accuracy
+            return hp_damage * accuracy
 
         # Medium value for less accurate moves
-        elif move.accuracy >= 0.7:
+        elif accuracy >= 0.7:
             turns_active = min(remaining_turns, 6)
             hp_damage = opponent_hp * 0.03 * turns_active
 
-            return hp_damage * move.accuracy
+            return hp_damage * accuracy
 
         return 0
 
@@ -485,15 +744,16 @@ class MyAgent(Player):
 
         Returns: HP value of healing or damage avoided (0-150+)
         """
-        active = battle.active_pokemon
+        ctx = self.get_turn_context(battle)
+        active = ctx.active
 
         # Check protect counter (diminishing returns)
-        protect_counter = active.protect_counter if hasattr(active, 'protect_counter') else 0
+        protect_counter = active.protect_counter
         if protect_counter >= 2:
             return 0  # Very likely to fail
 
         # High value for Poison Heal (Gliscor) - direct HP healing
-        if active.ability and "poison heal" in active.ability.lower():
+        if ctx.poison_heal:
             heal_value = (active.max_hp if active.max_hp else 100) * 0.125  # 12.5% HP
 
             if protect_counter == 0:
@@ -505,8 +765,7 @@ class MyAgent(Player):
         if protect_counter == 0:
             # Estimate opponent's best damage output
             # Use our best damage as proxy (similar power level)
-            best_damage = self.get_best_damage_score(battle)
-            return best_damage * 0.4  # Avoid ~40% of expected damage
+            return ctx.best_damage * 0.4  # Avoid ~40% of expected damage
 
         return 0
 
@@ -523,8 +782,6 @@ class MyAgent(Player):
         Conditions for use:
         - Opponent's stat isn't already debuffed (diminishing returns after first use)
         - For offensive debuffs (Screech/Fake Tears), must have corresponding move type
-        - Opponent's stat isn't already debuffed (diminishing returns after first use)
-        - For offensive debuffs (Screech/Fake Tears), must have corresponding move type
         - Setting up for a big attack (Screech then physical move)
 
         Strategy: Swampert can use Screech to soften up bulky Pokemon before
@@ -532,20 +789,24 @@ class MyAgent(Player):
 
         Returns: Extra damage from debuff over expected attacks (0-150+)
         """
-        opponent = battle.opponent_active_pokemon
-        active = battle.active_pokemon
-
-        if not opponent or not move.boosts or not active:
+        # Active Pokemon and damage anchors are read from the turn context rather
+        # than looked up again per stat
+        ctx = self.get_turn_context(battle)
+        opponent = ctx.opponent
+        active = ctx.active
+
+        boosts = self.get_move_info(move).boosts
+        if not opponent or not boosts or not active:
             return 0
 
-        remaining_turns = self.estimate_remaining_turns(battle)
         # Conservative estimate: 2 attacks before opponent switches or faints
-        expected_attacks = min(2, remaining_turns // 3)
+        expected_attacks = min(2, ctx.remaining_turns // 3)
+        opp_boosts = opponent.boosts
 
         # Check if opponent stat isn't already debuffed (diminishing returns)
-        for stat, debuff_amount in move.boosts.items():
+        for stat, debuff_amount in boosts.items():
             if debuff_amount < 0:  # It's a debuff
-                current_boost = opponent.boosts.get(stat, 0)
+                current_boost = opp_boosts.get(stat, 0)
 
                 # Already at cap, useless
                 if current_boost <= -6:
@@ -553,17 +814,17 @@ class MyAgent(Player):
 
                 # Context-aware: only use offensive debuffs if we have matching attack type
                 if stat == 'def':  # Defense debuff (Screech) - need physical moves
-                    best_damage = self.get_best_damage_score(battle, MoveCategory.PHYSICAL)
+                    best_damage = ctx.best_phys_damage
                     if best_damage == 0:
                         return 0  # No physical moves to follow up, useless
 
                 elif stat == 'spd':  # Sp. Def debuff (Fake Tears) - need special moves
-                    best_damage = self.get_best_damage_score(battle, MoveCategory.SPECIAL)
+                    best_damage = ctx.best_spec_damage
                     if best_damage == 0:
                         return 0  # No special moves to follow up, useless
                 else:
                     # Other debuffs (Speed, Accuracy, Evasion)
-                    best_damage = self.get_best_damage_score(battle)
+                    best_damage = ctx.best_damage
 
                 # -2 debuff = ~50% damage increase (Defense/SpDef drops)
                 extra_damage_per_hit = best_damage * 0.5
@@ -585,73 +846,80 @@ class MyAgent(Player):
 
     def evaluate_utility(self, battle, move):
         """
-        Evaluate utility moves (Trick, Rapid Spin, U-turn, Volt Switch, etc.).
+        Evaluate utility moves (Trick, Defog, etc.).
 
-        Utility: Catch-all for special-purpose moves that don't fit other categories:
+        Utility: Catch-all for special-purpose status moves that don't fit other
+        categories:
 
         - Trick: Swap held items (cripple opponent by giving them Choice item)
-        - Rapid Spin / Defog: Remove entry hazards from our side
-        - U-turn / Volt Switch / Flip Turn: Deal damage AND switch out (momentum)
+        - Defog: Remove entry hazards from our side
         - Healing moves: Recover HP
         - Weather setters: Set up sun/rain/sand/hail
 
+        Damaging utility moves (Rapid Spin, U-turn, Volt Switch, Flip Turn) never
+        get here: they are scored by their damage like any other attack.
+
         Strategy examples:
         - Chandelure: Use Trick to lock opponent into one move with Choice Specs
-        - Excadrill: Use Rapid Spin to clear hazards while dealing damage
-        - Swampert: Use Flip Turn to pivot and maintain momentum
 
-        Returns: Varies by move (STATUS_SCORE for Trick, DEBUFF_SCORE for hazard
-                 removal, damage score for pivoting moves, 50 as default)
+        Returns: Varies by move (share of the best damage score for Trick,
+                 HAZARD_DAMAGE_PER_SWITCH per expected switch-in for Defog,
+                 DEFAULT_UTILITY_SCORE as default)
         """
-        # Move-specific logic
-        move_id = move.id if hasattr(move, 'id') else str(move).lower()
-
-        # Trick (cripple with Choice item) - only effective once per battle
-        # Trick (cripple with Choice item) - only effective once per battle
-        if "trick" in move_id:
-            battle_tag = battle.battle_tag
-            if self.used_trick.get(battle_tag, False):
-                return 0  # Already used, swapping back is useless
+        # Move-specific logic, dispatched on the exact move id
+        move_id = move.id
+        evaluator = self._utility_evaluators.get(move_id)
+        if evaluator is not None:
+            return evaluator(battle, move)
 
-            # Mark as used
-            self.used_trick[battle_tag] = True
-
-            # Trick value = crippling opponent for remaining turns
-            remaining_turns = self.estimate_remaining_turns(battle)
-            best_damage = self.get_best_damage_score(battle)
+        # Default low value for unknown utility
+        return DEFAULT_UTILITY_SCORE
 
-            # Locking opponent into one move = significant value over remaining turns
-            # More valuable in longer battles
-            if remaining_turns > 5:
-                return best_damage * 1.5  # 150% of a damage move
-            else:
-                return best_damage * 0.8  # 80% of a damage move in short battles
-
-        # Rapid Spin (hazard removal)
-        if "rapidspin" in move_id or "defog" in move_id:
-            if battle.side_conditions and self.count_remaining_mons(battle.team) >= 2:
-                # Value based on preventing future hazard damage
-                our_remaining = self.count_remaining_mons(battle.team)
-                # Estimate 1-2 switches per remaining Pokemon
-                expected_switches = our_remaining * 1.5
-                # Each switch would take ~25 HP damage from hazards
-                return expected_switches * 25
-            return 0
+    def evaluate_trick(self, battle, move):
+        """
+        Evaluate Trick (cripple with Choice item) - only effective once per battle.
 
-        # U-turn/Volt Switch (pivoting moves) - use damage calc
-        if "uturn" in move_id or "voltswitch" in move_id or "flipturn" in move_id:
-            return self.evaluate_damage_move(battle, move)
+        Returns: Share of our best damage score, larger in longer battles
+        """
+        battle_tag = battle.battle_tag
+        if self.used_trick.get(battle_tag, False):
+            return 0  # Already used, swapping back is useless
+
+        # Mark as used
+        self.used_trick[battle_tag] = True
+        if len(self.used_trick) > MAX_TRACKED_BATTLES:
+            self.used_trick.popitem(last=False)
+
+        # Trick value = crippling opponent for remaining turns
+        ctx = self.get_turn_context(battle)
+        remaining_turns = ctx.remaining_turns
+        best_damage = ctx.best_damage
+
+        # Locking opponent into one move = significant value over remaining turns
+        # More valuable in longer battles
+        if remaining_turns > 5:
+            return best_damage * 1.5  # 150% of a damage move
+        else:
+            return best_damage * 0.8  # 80% of a damage move in short battles
 
-        # Default low value for unknown utility
-        return 50
+    def evaluate_hazard_removal(self, battle, move):
+        """
+        Evaluate Defog (hazard removal).
 
-async def main():
-    import logging
-    logging.basicConfig(level=logging.INFO)
+        Returns: Hazard damage prevented on our future switch-ins (0 if no hazards)
+        """
+        our_remaining = self.get_turn_context(battle).our_remaining
+        if battle.side_conditions and our_remaining >= 2:
+            # Value based on preventing future hazard damage
+            # Estimate 1-2 switches per remaining Pokemon
+            expected_switches = our_remaining * 1.5
+            # Each switch would take the usual hazard damage
+            return expected_switches * HAZARD_DAMAGE_PER_SWITCH
+        return 0
 
-    # Custom team in Pokemon Showdown's "packed" format
-    # Format: Pokemon | Ability | Item | Move1, Move2, Move3, Move4 | Nature | EVs | IVs | Level | Shiny
-    custom_team = """
+# Custom team in Pokemon Showdown's "packed" format
+# Format: Pokemon | Ability | Item | Move1, Move2, Move3, Move4 | Nature | EVs | IVs | Level | Shiny
+CUSTOM_TEAM = """
 Gliscor @ Toxic Orb  
 Ability: Poison Heal  
 Tera Type: Water  
@@ -715,30 +983,92 @@ IVs: 0 Atk
 - Trick  
 """
 
+# Parsed once at import so every MyAgent built from it reuses the packed team
+TEAM = ConstantTeambuilder(CUSTOM_TEAM)
+
+async def accept_loop(agent):
+    """
+    Accept challenges forever, restarting the acceptor only if it fails.
+
+    The same agent is reused across restarts: it owns the logged-in websocket
+    and the parsed team, so rebuilding it would repeat the login round-trip.
+
+    Restarts back off exponentially (1s, 2s, 4s, ... up to MAX_RETRY_DELAY) with
+    jitter, so an unreachable server does not cause a tight reconnect loop.
+    """
+    loop = asyncio.get_running_loop()
+    failures = 0
+    while True:
+        started = loop.time()
+        try:
+            # One long-running acceptor is enough: poke-env caps running battles at
+            # max_concurrent_battles through the player's battle-count queue, and
+            # waits for each accepted battle to start before taking the next one.
+            await agent.accept_challenges(None, n_challenges=sys.maxsize)
+        except Exception:
+            # An acceptor that ran for a while was healthy; start backing off afresh
+            if loop.time() - started > MAX_RETRY_DELAY:
+                failures = 0
+            delay = min(MAX_RETRY_DELAY, 2 ** failures) + random.random()
+            failures += 1
+            logger.exception("Challenge loop error (retrying in %.1fs)", delay)
+            await asyncio.sleep(delay)
+
+def setup_logging():
+    """
+    Configure logging so records are written off the event loop threads.
+
+    Handlers attached to the root logger only enqueue records; a QueueListener
+    thread does the actual stream writes. main() also routes the player's own
+    poke-env logger here, so battle logging on poke-env's loop does not wait on
+    a slow terminal.
+
+    Returns: The started QueueListener (stop it on shutdown to flush)
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    # QueueHandler formats records before enqueueing them; use the layout of
+    # poke-env's per-player handler, which main() replaces
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    listener.start()
+    return listener
+
+async def main():
+    listener = setup_logging()
+
     # Bot will wait for challenges from human players
     # Generate unique username to avoid conflicts
+    # The agent is built once and kept for the life of the process (see accept_loop)
     username = "MyBot999"
     account = AccountConfiguration(username, None)
     agent = MyAgent(
         account_configuration=account,
         battle_format="gen9ou",
-        team=custom_team,
-        max_concurrent_battles=10
+        team=TEAM,
+        max_concurrent_battles=MAX_CONCURRENT_BATTLES
     )
 
-    print(f"Bot is running and accepting battles!")
-    print(f"Bot username: {agent.username}")
-    print(f"Go to http://localhost:8000")
-    print(f"Challenge '{agent.username}' to a gen9ou battle")
-    print("Press Ctrl+C to stop the bot\n")
+    # poke-env gives the player its own StreamHandler, which writes synchronously
+    # on the loop that runs the battles. Drop it: the player's records still
+    # propagate to the root QueueHandler (and are no longer printed twice)
+    for handler in list(agent.logger.handlers):
+        agent.logger.removeHandler(handler)
+
+    logger.info("Bot is running and accepting battles!")
+    logger.info("Bot username: %s", agent.username)
+    logger.info("Go to http://localhost:8000")
+    logger.info("Challenge '%s' to a gen9ou battle", agent.username)
+    logger.info("Press Ctrl+C to stop the bot")
 
     # Keep bot running indefinitely, accepting challenges
-    while True:
-        try:
-            await agent.accept_challenges(None, n_challenges=1)
-        except Exception as e:
-            print(f"Error: {e}")
-            await asyncio.sleep(1)
+    try:
+        await accept_loop(agent)
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
-    asyncio.get_event_loop().run_until_complete(main())
+    asyncio.run(main())
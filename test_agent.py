@@ -0,0 +1,166 @@
+import logging
+
+from poke_env import AccountConfiguration
+from poke_env.battle import Battle, Move
+
+from agent import TEAM, MyAgent
+
+
+def make_agent():
+    return MyAgent(
+        account_configuration=AccountConfiguration("TestBot", None),
+        battle_format="gen9ou",
+        team=TEAM,
+        start_listening=False,
+    )
+
+
+def make_battle(
+    our_hp="341/341",
+    their_hp="100/100",
+    ours="Excadrill",
+    theirs="Garchomp",
+    moves=("swordsdance", "earthquake", "ironhead", "rapidspin"),
+):
+    """A turn-1 battle, by default Excadrill vs Garchomp with Excadrill's four moves."""
+    battle = Battle("battle-gen9ou-1", "TestBot", logging.getLogger("test"), gen=9)
+    battle.player_role = "p1"
+
+    our_mon = battle.get_pokemon(f"p1: {ours}")
+    their_mon = battle.get_pokemon(f"p2: {theirs}")
+    our_mon.switch_in()
+    their_mon.switch_in()
+    our_mon.set_hp(our_hp)
+    their_mon.set_hp(their_hp)
+
+    battle._available_moves = [Move(move_id, gen=9) for move_id in moves]
+    return battle
+
+
+EXCADRILL_STATS = {"hp": 341, "atk": 369, "def": 156, "spa": 122, "spd": 166, "spe": 302}
+GARCHOMP_STATS = {"hp": 357, "atk": 296, "def": 226, "spa": 176, "spd": 206, "spe": 303}
+
+
+def give_stats(battle, ours=EXCADRILL_STATS, theirs=GARCHOMP_STATS):
+    """Known stats on both sides, as in random battles, so the damage calculator runs."""
+    battle.active_pokemon.stats = dict(ours)
+    battle.opponent_active_pokemon.stats = dict(theirs)
+    return battle
+
+
+def test_estimate_matchup_caches_type_multipliers():
+    agent = make_agent()
+    battle = make_battle()
+    ours, theirs = battle.active_pokemon, battle.opponent_active_pokemon
+
+    first = agent.estimate_matchup(ours, theirs)
+    second = agent.estimate_matchup(ours, theirs)
+    assert first == second
+    # Excadrill's best type is neutral on Garchomp; Garchomp's Ground hits it for 2x
+    assert agent._type_matchup_cache == {
+        (tuple(ours.types), tuple(theirs.types)): (1, 2)
+    }
+
+
+def test_estimate_matchup_rekeys_on_a_changed_typing():
+    agent = make_agent()
+    battle = make_battle()
+    ours, theirs = battle.active_pokemon, battle.opponent_active_pokemon
+    agent.estimate_matchup(ours, theirs)
+
+    # Tera Fairy: Excadrill's Steel is now super effective and resists Fairy
+    theirs.terastallize("fairy")
+    agent.estimate_matchup(ours, theirs)
+    assert len(agent._type_matchup_cache) == 2
+    assert agent._type_matchup_cache[(tuple(ours.types), tuple(theirs.types))] == (2, 0.5)
+
+
+def test_damage_calculator_scores_moves_with_known_stats():
+    agent = make_agent()
+    battle = give_stats(make_battle())
+    agent.choose_move(battle)
+
+    damage_scores = agent.get_turn_context(battle).damage_scores
+    # Calculated damage, not the base-power fallback, and no recorded failures
+    assert damage_scores["earthquake"] != 100
+    assert damage_scores["earthquake"] > damage_scores["ironhead"]
+    assert not agent.get_damage_calc_failures(battle)
+
+
+def test_guaranteed_ko_compares_damage_with_real_hp():
+    # Earthquake rolls 177-208 against Garchomp's 357 HP: no sure KO at full HP,
+    # even though the opponent's current_hp reads 100 on Showdown's percent scale
+    agent = make_agent()
+    battle = give_stats(make_battle())
+    agent.choose_move(battle)
+    assert agent.get_turn_context(battle).ko_move is None
+
+    # At 40% (~143 HP) even the lowest roll knocks it out
+    agent = make_agent()
+    battle = give_stats(make_battle(their_hp="40/100"))
+    order = agent.choose_move(battle)
+    assert agent.get_turn_context(battle).ko_move.id == "earthquake"
+    assert order.message == "/choose move earthquake"
+
+
+def test_protect_heals_with_poison_heal():
+    battle = make_battle(
+        our_hp="353/353",
+        ours="Gliscor",
+        moves=("protect", "earthquake", "knockoff", "toxic"),
+    )
+    battle.active_pokemon.ability = "Poison Heal"  # Stored as the id "poisonheal"
+    agent = make_agent()
+
+    protect = battle.available_moves[0]
+    assert agent.get_turn_context(battle).poison_heal
+    # 1/8 of max HP on a fresh Protect
+    assert agent.evaluate_protect(battle, protect) == 353 * 0.125
+
+
+def test_guaranteed_ko_prefers_the_most_accurate_move():
+    # Volcarona at 20% (~62 HP): Stone Edge, Knock Off and Ice Punch all KO on
+    # their lowest roll, but Stone Edge only hits 80% of the time
+    battle = give_stats(
+        make_battle(
+            our_hp="341/341",
+            their_hp="20/100",
+            ours="Tyranitar",
+            theirs="Volcarona",
+            moves=("stoneedge", "knockoff", "icepunch", "dragondance"),
+        ),
+        ours={"hp": 341, "atk": 403, "def": 256, "spa": 203, "spd": 236, "spe": 243},
+        theirs={"hp": 311, "atk": 156, "def": 166, "spa": 369, "spd": 246, "spe": 299},
+    )
+    agent = make_agent()
+
+    order = agent.choose_move(battle)
+    # Knock Off and Ice Punch are both 100% accurate; Knock Off wins the tie on damage
+    assert order.message == "/choose move knockoff"
+
+
+def test_guaranteed_ko_needs_the_opponents_stats():
+    # Without injected stats the opponent's are unknown, as in gen9ou: even at 5%
+    # HP there is no sure KO, and every move is scored as usual
+    agent = make_agent()
+    battle = make_battle(their_hp="5/100")
+    battle.active_pokemon.stats = dict(EXCADRILL_STATS)
+    order = agent.choose_move(battle)
+
+    assert agent.get_turn_context(battle).ko_move is None
+    assert order.message == "/choose move earthquake"
+    assert not agent.get_damage_calc_failures(battle)
+
+
+def test_swords_dance_is_scored_as_a_setup_move():
+    # Swords Dance lists its +2 Atk under boosts with a self target, not self_boost
+    agent = make_agent()
+    favorable = make_battle(theirs="Heatran")
+    swords_dance = favorable.available_moves[0]
+    assert agent.get_move_info(swords_dance).self_boost == {"atk": 2}
+
+    # With one mon a side about 5 turns remain: two attacks at +50% of Earthquake's
+    # base power (100), less half an attack for the turn spent setting up
+    assert agent.evaluate_status_move(favorable, swords_dance) == 50
+    # Garchomp outspeeds and hits Excadrill super effectively: no time to set up
+    assert agent.evaluate_status_move(make_battle(), swords_dance) == 0